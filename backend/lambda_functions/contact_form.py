@@ -15,31 +15,108 @@ Optionally stores contact in DynamoDB.
 
 import json
 import os
-import uuid
 import logging
 import re
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-import boto3
-from botocore.exceptions import ClientError
-
-# Configure logging
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from secrets import token_hex
+from string import Formatter
+from time import gmtime, strftime
+
+from boto3 import client as _boto_client, resource as _boto_resource
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+
+# Configure logging (set LOG_LEVEL=WARNING in production to skip per-request info logs;
+# unrecognized values fall back to INFO rather than failing at import)
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').strip().upper()
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
-
-# Initialize AWS clients
-ses_client = boto3.client('ses')
-dynamodb = boto3.resource('dynamodb')
+logger.setLevel(LOG_LEVEL if LOG_LEVEL in logging.getLevelNamesMapping() else logging.INFO)
 
 # Configuration
 FROM_EMAIL = os.environ.get('FROM_EMAIL', 'orders@rrinconline.com')
-STAFF_EMAILS = os.environ.get('STAFF_EMAILS', 'arturo@rrinconline.com,ramonecardonna@gmail.com').split(',')
+STAFF_EMAILS = tuple(
+    email.strip()
+    for email in os.environ.get('STAFF_EMAILS', 'arturo@rrinconline.com,ramonecardonna@gmail.com').split(',')
+    if email.strip()
+)
 CONTACTS_TABLE = os.environ.get('CONTACTS_TABLE', 'sticker_magnet_lab_contacts')
 STORE_CONTACTS = os.environ.get('STORE_CONTACTS', 'true').lower() == 'true'
+# Largest accepted request body (10,000 char message cap plus field/JSON overhead)
+MAX_BODY_LENGTH = 20000
+# Passthrough SES template (see ses_setup.py). When set, both contact emails
+# are delivered with a single SendBulkTemplatedEmail call.
+CONTACT_EMAIL_TEMPLATE = os.environ.get('CONTACT_EMAIL_TEMPLATE', '')
+
+# ISO 8601 UTC timestamp format for contact records
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+# Response headers shared by every response (never mutated)
+CORS_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
+    'Access-Control-Allow-Methods': 'POST,OPTIONS'
+}
+
+# Precompiled patterns (compiled once per container, reused on warm starts)
+EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;'
+})
+
+# Shared client config: keep pooled HTTPS connections alive across warm
+# invocations, size the pool for the concurrent sends, and fail fast.
+_BOTO_CFG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=25,
+    connect_timeout=2,
+    read_timeout=5,
+    retries={'max_attempts': 2, 'mode': 'standard'}
+)
+
+# Initialize AWS clients (module scope so warm starts reuse them).
+# The DynamoDB resource model is only loaded when contacts are stored.
+ses_client = _boto_client('ses', config=_BOTO_CFG)
+dynamodb = _boto_resource('dynamodb', config=_BOTO_CFG) if STORE_CONTACTS else None
+CONTACTS_TABLE_OBJ = dynamodb.Table(CONTACTS_TABLE) if STORE_CONTACTS else None
+
+
+def _prewarm_clients() -> None:
+    """
+    Open the module clients' HTTPS connections during the Lambda init phase.
+
+    The first request on a client pays DNS lookup and the TLS handshake.
+    Issuing one cheap call on ses_client and CONTACTS_TABLE_OBJ at import
+    leaves a kept-alive connection in their own pools, so the first billed
+    invocation reuses it. The calls are bounded by _BOTO_CFG's timeouts
+    and retry cap. Failures are logged and otherwise ignored.
+    """
+    try:
+        ses_client.get_send_quota()
+    except (BotoCoreError, ClientError) as e:
+        logger.warning("SES pre-warm failed: %s", e)
+
+    if CONTACTS_TABLE_OBJ is not None:
+        try:
+            CONTACTS_TABLE_OBJ.table_status
+        except (BotoCoreError, ClientError) as e:
+            logger.warning("DynamoDB pre-warm failed: %s", e)
+
 
+# Only pre-warm inside Lambda, not in local tooling or tests
+if os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
+    _prewarm_clients()
 
-def build_cors_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
+# Worker pool for the per-request I/O (SES sends + DynamoDB put); kept at
+# module scope so warm invocations reuse the threads.
+_POOL = ThreadPoolExecutor(max_workers=3)
+
+
+def build_cors_response(status_code: int, body: dict) -> dict:
     """
     Build HTTP response with CORS headers.
 
@@ -52,13 +129,8 @@ def build_cors_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any
     """
     return {
         'statusCode': status_code,
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
-            'Access-Control-Allow-Methods': 'POST,OPTIONS'
-        },
-        'body': json.dumps(body)
+        'headers': CORS_HEADERS,
+        'body': json.dumps(body, separators=(',', ':'))
     }
 
 
@@ -72,8 +144,11 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    # Cheap gates first (RFC 5321 caps addresses at 254 chars)
+    if not email or len(email) > 254 or email.count('@') != 1:
+        return False
+
+    return EMAIL_RE.match(email) is not None
 
 
 def sanitize_input(text: str, max_length: int = 5000) -> str:
@@ -90,57 +165,50 @@ def sanitize_input(text: str, max_length: int = 5000) -> str:
     if not text:
         return ''
 
-    # Trim to max length
-    text = text[:max_length]
-
-    # Basic HTML entity encoding for display
-    text = text.replace('&', '&amp;')
-    text = text.replace('<', '&lt;')
-    text = text.replace('>', '&gt;')
-    text = text.replace('"', '&quot;')
-    text = text.replace("'", '&#x27;')
+    # Trim to max length, then HTML entity encode for display in one pass
+    return text[:max_length].translate(_HTML_ESCAPE_TABLE)
 
-    return text
 
-
-def validate_contact_form(data: Dict) -> List[str]:
+def validate_contact_form(data: dict) -> tuple[list[str], dict[str, str]]:
     """
-    Validate contact form data.
+    Validate contact form data in a single pass.
 
     Args:
         data: Form data dictionary
 
     Returns:
-        List of validation errors (empty if valid)
+        Tuple of (list of validation errors, empty if valid; cleaned form
+        fields with name, email, subject and message stripped)
     """
     errors = []
 
-    # Required fields
-    if not data.get('name', '').strip():
+    name = (data.get('name') or '').strip()
+    email = (data.get('email') or '').strip()
+    subject = (data.get('subject') or '').strip()
+    message = (data.get('message') or '').strip()
+
+    if not name:
         errors.append('Name is required')
+    elif len(name) > 200:
+        errors.append('Name must be less than 200 characters')
 
-    if not data.get('email', '').strip():
+    if not email:
         errors.append('Email is required')
-    elif not validate_email(data.get('email', '')):
+    elif not validate_email(email):
         errors.append('Invalid email format')
 
-    if not data.get('message', '').strip():
-        errors.append('Message is required')
-
-    # Length validations
-    if len(data.get('name', '')) > 200:
-        errors.append('Name must be less than 200 characters')
-
-    if len(data.get('subject', '')) > 500:
+    if len(subject) > 500:
         errors.append('Subject must be less than 500 characters')
 
-    if len(data.get('message', '')) > 10000:
+    if not message:
+        errors.append('Message is required')
+    elif len(message) > 10000:
         errors.append('Message must be less than 10,000 characters')
 
-    return errors
+    return errors, {'name': name, 'email': email, 'subject': subject, 'message': message}
 
 
-def send_email(to_emails: List[str], subject: str, html_body: str, text_body: str = '') -> bool:
+def send_email(to_emails: list[str], subject: str, html_body: str, text_body: str) -> bool:
     """
     Send an email via AWS SES.
 
@@ -148,16 +216,11 @@ def send_email(to_emails: List[str], subject: str, html_body: str, text_body: st
         to_emails: List of recipient email addresses
         subject: Email subject
         html_body: HTML email body
-        text_body: Plain text email body (optional)
+        text_body: Plain text email body
 
     Returns:
         True if email sent successfully, False otherwise
     """
-    if not text_body:
-        # Generate simple text version from HTML
-        text_body = html_body.replace('<br>', '\n').replace('</p>', '\n')
-        text_body = re.sub('<[^<]+?>', '', text_body)
-
     try:
         response = ses_client.send_email(
             Source=FROM_EMAIL,
@@ -181,25 +244,120 @@ def send_email(to_emails: List[str], subject: str, html_body: str, text_body: st
                 }
             }
         )
-        logger.info(f"Email sent successfully. Message ID: {response['MessageId']}")
+        logger.info("Email sent successfully. Message ID: %s", response['MessageId'])
         return True
 
     except ClientError as e:
-        logger.error(f"Failed to send email: {str(e)}")
+        logger.error("Failed to send email: %s", e)
         return False
 
 
-def get_staff_notification_html(contact: Dict) -> str:
+def send_bulk_emails(messages: list[dict]) -> list[bool]:
+    """
+    Send several emails with one SES SendBulkTemplatedEmail call.
+
+    Each message is rendered through the CONTACT_EMAIL_TEMPLATE passthrough
+    template, so subject and bodies travel as replacement data.
+
+    Args:
+        messages: List of dicts with to_emails, subject, html_body and
+            text_body keys
+
+    Returns:
+        Success flag for each message, in order
+    """
+    destinations = [
+        {
+            'Destination': {
+                'ToAddresses': list(msg['to_emails'])
+            },
+            'ReplacementTemplateData': json.dumps({
+                'subject': msg['subject'],
+                'html': msg['html_body'],
+                'text': msg['text_body']
+            })
+        }
+        for msg in messages
+    ]
+
+    try:
+        response = ses_client.send_bulk_templated_email(
+            Source=FROM_EMAIL,
+            Template=CONTACT_EMAIL_TEMPLATE,
+            DefaultTemplateData='{}',
+            Destinations=destinations
+        )
+
+    except ClientError as e:
+        logger.error("Failed to send bulk email: %s", e)
+        return [False] * len(messages)
+
+    results = []
+    for status in response['Status']:
+        if status['Status'] == 'Success':
+            logger.info("Email sent successfully. Message ID: %s", status['MessageId'])
+            results.append(True)
+        else:
+            logger.error("Failed to send email: %s - %s", status['Status'], status.get('Error', ''))
+            results.append(False)
+
+    return results
+
+
+def _compact_template(template: str) -> str:
+    """
+    Strip source indentation from an HTML template at import time.
+
+    Leading whitespace on every line is only there for readability, but
+    it is sent (and URL-encoded by the SES query API) with every email.
+    User content is substituted later and is left untouched.
+
+    Args:
+        template: Indented HTML template
+
+    Returns:
+        Template with each line stripped
+    """
+    return '\n'.join(line.strip() for line in template.strip().splitlines())
+
+
+def _split_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    """
+    Pre-parse a str.format template into (literal, field name) pairs.
+
+    Parsing happens once at import, so the constant text sits in module
+    state (and in a SnapStart snapshot) and rendering is a single join.
+
+    Args:
+        template: Template with {field} placeholders
+
+    Returns:
+        Tuple of (literal text, field name or None) pairs
+    """
+    return tuple((literal, field) for literal, field, _, _ in Formatter().parse(template))
+
+
+def _render_template(parts: tuple[tuple[str, str | None], ...], fields: dict[str, str]) -> str:
     """
-    Generate staff notification email HTML.
+    Render a template pre-split by _split_template.
 
     Args:
-        contact: Contact form data
+        parts: Pre-split template parts
+        fields: Values for every field in the template
 
     Returns:
-        HTML email body
+        Rendered template
     """
-    return f"""
+    pieces = []
+    for literal, field in parts:
+        pieces.append(literal)
+        if field is not None:
+            pieces.append(fields[field])
+    return ''.join(pieces)
+
+
+# Email templates are built once at import; only the placeholders are filled per request
+_STAFF_NOTIFICATION_TMPL = _compact_template("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -212,51 +370,90 @@ def get_staff_notification_html(contact: Dict) -> str:
 
         <div style="background: #fff; padding: 20px; border: 1px solid #ddd; border-top: none;">
             <div style="background: #f8f9fa; padding: 15px; border-radius: 5px; margin-bottom: 20px;">
-                <p style="margin: 5px 0;"><strong>Date:</strong> {contact.get('timestamp', '')}</p>
-                <p style="margin: 5px 0;"><strong>Contact ID:</strong> {contact.get('contactId', '')}</p>
+                <p style="margin: 5px 0;"><strong>Date:</strong> {timestamp}</p>
+                <p style="margin: 5px 0;"><strong>Contact ID:</strong> {contactId}</p>
             </div>
 
             <h3 style="color: #333; border-bottom: 2px solid #17a2b8; padding-bottom: 10px;">Contact Information</h3>
             <table style="width: 100%; margin-bottom: 20px;">
                 <tr>
                     <td style="padding: 8px 0; width: 100px;"><strong>Name:</strong></td>
-                    <td>{contact.get('name', '')}</td>
+                    <td>{name}</td>
                 </tr>
                 <tr>
                     <td style="padding: 8px 0;"><strong>Email:</strong></td>
-                    <td><a href="mailto:{contact.get('email', '')}">{contact.get('email', '')}</a></td>
+                    <td><a href="mailto:{email}">{email}</a></td>
                 </tr>
                 <tr>
                     <td style="padding: 8px 0;"><strong>Subject:</strong></td>
-                    <td>{contact.get('subject', 'No subject')}</td>
+                    <td>{subject}</td>
                 </tr>
             </table>
 
             <h3 style="color: #333; border-bottom: 2px solid #17a2b8; padding-bottom: 10px;">Message</h3>
             <div style="background: #f8f9fa; padding: 15px; border-radius: 5px; white-space: pre-wrap;">
-{contact.get('message', '')}
+{message}
             </div>
 
             <div style="margin-top: 20px; padding: 15px; background: #e7f3ff; border-radius: 5px;">
-                <p style="margin: 0;"><strong>Reply directly:</strong> <a href="mailto:{contact.get('email', '')}?subject=Re: {contact.get('subject', 'Your inquiry to Sticker & Magnet Lab')}">{contact.get('email', '')}</a></p>
+                <p style="margin: 0;"><strong>Reply directly:</strong> <a href="mailto:{email}?subject=Re: {reply_subject}">{email}</a></p>
             </div>
         </div>
     </body>
     </html>
-    """
+    """)
+_STAFF_NOTIFICATION_PARTS = _split_template(_STAFF_NOTIFICATION_TMPL)
+
+_STAFF_NOTIFICATION_TEXT_TMPL = """New Contact Form Submission
+
+Date: {timestamp}
+Contact ID: {contactId}
+
+Contact Information
+Name: {name}
+Email: {email}
+Subject: {subject}
 
+Message
+{message}
 
-def get_auto_reply_html(contact: Dict) -> str:
+Reply directly: {email}
+"""
+_STAFF_NOTIFICATION_TEXT_PARTS = _split_template(_STAFF_NOTIFICATION_TEXT_TMPL)
+
+
+def _staff_notification_fields(contact: dict) -> dict[str, str]:
+    """Map contact data onto the staff notification template fields."""
+    return {
+        'timestamp': contact.get('timestamp', ''),
+        'contactId': contact.get('contactId', ''),
+        'name': contact.get('name', ''),
+        'email': contact.get('email', ''),
+        'subject': contact.get('subject', 'No subject'),
+        'reply_subject': contact.get('subject', 'Your inquiry to Sticker & Magnet Lab'),
+        'message': contact.get('message', '')
+    }
+
+
+def get_staff_notification_html(contact: dict, plain: dict | None = None) -> tuple[str, str]:
     """
-    Generate customer auto-reply email HTML.
+    Generate staff notification email bodies.
 
     Args:
-        contact: Contact form data
+        contact: Contact form data (HTML-escaped), used for the HTML body
+        plain: Unescaped contact form data for the plain text body
+            (defaults to contact)
 
     Returns:
-        HTML email body
+        Tuple of (HTML email body, plain text email body)
     """
-    return f"""
+    return (
+        _render_template(_STAFF_NOTIFICATION_PARTS, _staff_notification_fields(contact)),
+        _render_template(_STAFF_NOTIFICATION_TEXT_PARTS, _staff_notification_fields(plain or contact))
+    )
+
+
+_AUTO_REPLY_TMPL = _compact_template("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -269,15 +466,15 @@ def get_auto_reply_html(contact: Dict) -> str:
         </div>
 
         <div style="background: #fff; padding: 30px; border: 1px solid #e0e0e0; border-top: none;">
-            <h2 style="color: #333; margin-top: 0;">Thank you for contacting us, {contact.get('name', 'Customer')}!</h2>
+            <h2 style="color: #333; margin-top: 0;">Thank you for contacting us, {name}!</h2>
 
             <p>We've received your message and will get back to you as soon as possible, typically within 1-2 business days.</p>
 
             <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin: 20px 0;">
                 <h3 style="margin-top: 0; color: #555;">Your Message:</h3>
-                <p style="margin: 5px 0;"><strong>Subject:</strong> {contact.get('subject', 'General Inquiry')}</p>
+                <p style="margin: 5px 0;"><strong>Subject:</strong> {subject}</p>
                 <div style="margin-top: 10px; padding: 10px; background: white; border-radius: 5px; white-space: pre-wrap;">
-{contact.get('message', '')}
+{message}
                 </div>
             </div>
 
@@ -296,10 +493,58 @@ def get_auto_reply_html(contact: Dict) -> str:
         </div>
     </body>
     </html>
+    """)
+_AUTO_REPLY_PARTS = _split_template(_AUTO_REPLY_TMPL)
+
+_AUTO_REPLY_TEXT_TMPL = """Sticker & Magnet Lab
+
+Thank you for contacting us, {name}!
+
+We've received your message and will get back to you as soon as possible, typically within 1-2 business days.
+
+Your Message:
+Subject: {subject}
+
+{message}
+
+In the meantime, feel free to browse our products or check out our FAQ section.
+
+Thank you for choosing Sticker & Magnet Lab!
+orders@rrinconline.com
+
+This is an automated response. Please do not reply directly to this email.
+"""
+_AUTO_REPLY_TEXT_PARTS = _split_template(_AUTO_REPLY_TEXT_TMPL)
+
+
+def _auto_reply_fields(contact: dict) -> dict[str, str]:
+    """Map contact data onto the auto-reply template fields."""
+    return {
+        'name': contact.get('name', 'Customer'),
+        'subject': contact.get('subject', 'General Inquiry'),
+        'message': contact.get('message', '')
+    }
+
+
+def get_auto_reply_html(contact: dict, plain: dict | None = None) -> tuple[str, str]:
     """
+    Generate customer auto-reply email bodies.
 
+    Args:
+        contact: Contact form data (HTML-escaped), used for the HTML body
+        plain: Unescaped contact form data for the plain text body
+            (defaults to contact)
 
-def store_contact(contact: Dict) -> bool:
+    Returns:
+        Tuple of (HTML email body, plain text email body)
+    """
+    return (
+        _render_template(_AUTO_REPLY_PARTS, _auto_reply_fields(contact)),
+        _render_template(_AUTO_REPLY_TEXT_PARTS, _auto_reply_fields(plain or contact))
+    )
+
+
+def store_contact(contact: dict) -> bool:
     """
     Store contact form submission in DynamoDB.
 
@@ -313,17 +558,31 @@ def store_contact(contact: Dict) -> bool:
         return True
 
     try:
-        table = dynamodb.Table(CONTACTS_TABLE)
-        table.put_item(Item=contact)
-        logger.info(f"Contact {contact['contactId']} stored in DynamoDB")
+        CONTACTS_TABLE_OBJ.put_item(Item=contact)
+        logger.info("Contact %s stored in DynamoDB", contact['contactId'])
         return True
 
     except ClientError as e:
-        logger.error(f"Failed to store contact: {str(e)}")
+        logger.error("Failed to store contact: %s", e)
         return False
 
 
-def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+def _log_store_failure(future: Future) -> None:
+    """
+    Log an unexpected error raised by a background store_contact call.
+
+    ClientErrors are already logged inside store_contact; this catches
+    anything else so a failed put is logged without failing the request.
+
+    Args:
+        future: Completed store_contact future
+    """
+    error = future.exception()
+    if error is not None:
+        logger.error("Failed to store contact: %s", error)
+
+
+def lambda_handler(event: dict, context: object) -> dict:
     """
     Main Lambda handler for POST /api/contact.
 
@@ -345,6 +604,13 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         body = event.get('body', '')
 
         if isinstance(body, str):
+            # Reject oversized payloads before spending time parsing them
+            if len(body) > MAX_BODY_LENGTH:
+                return build_cors_response(413, {
+                    'success': False,
+                    'error': 'Request body too large'
+                })
+
             try:
                 body = json.loads(body)
             except json.JSONDecodeError:
@@ -353,8 +619,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     'error': 'Invalid JSON in request body'
                 })
 
-        # Validate form data
-        validation_errors = validate_contact_form(body)
+        # Validate form data (also returns the stripped fields)
+        validation_errors, cleaned = validate_contact_form(body)
         if validation_errors:
             return build_cors_response(400, {
                 'success': False,
@@ -363,33 +629,56 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             })
 
         # Prepare contact record
-        now = datetime.utcnow()
         contact = {
-            'contactId': f"CONTACT-{str(uuid.uuid4())[:8]}",
-            'name': sanitize_input(body.get('name', '').strip(), 200),
-            'email': body.get('email', '').strip().lower(),
-            'subject': sanitize_input(body.get('subject', 'General Inquiry').strip(), 500),
-            'message': sanitize_input(body.get('message', '').strip(), 10000),
-            'timestamp': now.isoformat() + 'Z',
+            'contactId': f"CONTACT-{token_hex(4)}",
+            'name': sanitize_input(cleaned['name'], 200),
+            'email': cleaned['email'].lower(),
+            'subject': sanitize_input(cleaned['subject'] or 'General Inquiry', 500),
+            'message': sanitize_input(cleaned['message'], 10000),
+            'timestamp': strftime(TIMESTAMP_FORMAT, gmtime()),
             'status': 'new'
         }
 
-        logger.info(f"Processing contact {contact['contactId']} from {contact['email']}")
+        # Same fields unescaped, for the plain text bodies and subject line
+        plain = {
+            **contact,
+            'name': cleaned['name'][:200],
+            'subject': (cleaned['subject'] or 'General Inquiry')[:500],
+            'message': cleaned['message'][:10000]
+        }
 
-        # Store in DynamoDB (optional)
-        stored = store_contact(contact)
+        logger.info("Processing contact %s from %s", contact['contactId'], contact['email'])
 
-        # Send staff notification
-        staff_subject = f"Contact Form: {contact['subject'][:50]}"
-        staff_html = get_staff_notification_html(contact)
-        staff_sent = send_email(STAFF_EMAILS, staff_subject, staff_html)
+        # Store in DynamoDB (optional) alongside the sends. It is waited on
+        # before returning (a frozen Lambda may never finish it otherwise),
+        # but the response does not depend on it, so failures are only logged.
+        store_future = _POOL.submit(store_contact, contact)
+        store_future.add_done_callback(_log_store_failure)
 
-        # Send auto-reply to customer
+        # Staff notification and auto-reply to customer
+        staff_subject = f"Contact Form: {plain['subject'][:50]}"
+        staff_html, staff_text = get_staff_notification_html(contact, plain)
         reply_subject = "Thank you for contacting Sticker & Magnet Lab"
-        reply_html = get_auto_reply_html(contact)
-        reply_sent = send_email([contact['email']], reply_subject, reply_html)
-
-        logger.info(f"Contact processed - Staff notified: {staff_sent}, Auto-reply sent: {reply_sent}")
+        reply_html, reply_text = get_auto_reply_html(contact, plain)
+
+        if CONTACT_EMAIL_TEMPLATE:
+            # One SES round trip delivers both emails
+            staff_sent, reply_sent = send_bulk_emails([
+                {'to_emails': STAFF_EMAILS, 'subject': staff_subject,
+                 'html_body': staff_html, 'text_body': staff_text},
+                {'to_emails': [contact['email']], 'subject': reply_subject,
+                 'html_body': reply_html, 'text_body': reply_text}
+            ])
+            wait((store_future,))
+        else:
+            # Both sends run concurrently with the store; wait for all of them
+            staff_future = _POOL.submit(send_email, STAFF_EMAILS, staff_subject, staff_html, staff_text)
+            reply_future = _POOL.submit(send_email, [contact['email']], reply_subject, reply_html, reply_text)
+            wait((store_future, staff_future, reply_future))
+            staff_sent = staff_future.result()
+            reply_sent = reply_future.result()
+
+        logger.info("Contact processed - Staff notified: %s, Auto-reply sent: %s", staff_sent, reply_sent)
 
         return build_cors_response(200, {
             'success': True,
@@ -400,7 +689,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     except ClientError as e:
         error_code = e.response['Error']['Code']
         error_message = e.response['Error']['Message']
-        logger.error(f"AWS error: {error_code} - {error_message}")
+        logger.error("AWS error: %s - %s", error_code, error_message)
 
         return build_cors_response(500, {
             'success': False,
@@ -408,7 +697,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         })
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
 
         return build_cors_response(500, {
             'success': False,
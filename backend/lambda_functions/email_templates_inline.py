@@ -5,6 +5,7 @@ These templates are used when the utils module is not available
 (i.e., when Lambda functions are deployed individually).
 """
 
+from html import escape
 from typing import Any, Dict
 
 
@@ -33,9 +34,9 @@ def get_customer_confirmation_html(order: Dict[str, Any]) -> str:
     Returns:
         Complete HTML email body
     """
-    order_id = order.get('orderId', 'N/A')
-    customer_name = order.get('customerInfo', {}).get('name', 'Valued Customer')
-    order_date = order.get('orderDate', '')[:10]
+    order_id = escape(str(order.get('orderId', 'N/A')))
+    customer_name = escape(str(order.get('customerInfo', {}).get('name', 'Valued Customer')))
+    order_date = escape(str(order.get('orderDate', ''))[:10])
     items = order.get('items', [])
     subtotal = float(order.get('subtotal', 0))
     shipping = float(order.get('shipping', 0))
@@ -44,9 +45,9 @@ def get_customer_confirmation_html(order: Dict[str, Any]) -> str:
     # Build items table rows
     items_html = ""
     for item in items:
-        product_type = item.get('productType', '').replace('_', ' ').title()
-        size = item.get('size', '')
-        quantity = item.get('quantity', 0)
+        product_type = escape(str(item.get('productType', '')).replace('_', ' ').title())
+        size = escape(str(item.get('size', '')))
+        quantity = escape(str(item.get('quantity', 0)))
         total_price = float(item.get('totalPrice', 0))
 
         items_html += f"""
@@ -165,9 +166,12 @@ def get_staff_notification_html(order: Dict[str, Any]) -> str:
     Returns:
         Complete HTML email body for staff
     """
-    order_id = order.get('orderId', 'N/A')
-    order_date = order.get('orderDate', '')
+    order_id = escape(str(order.get('orderId', 'N/A')))
+    order_date = escape(str(order.get('orderDate', '')))
     customer_info = order.get('customerInfo', {})
+    customer_name = escape(str(customer_info.get('name', 'N/A')))
+    customer_email = escape(str(customer_info.get('email', '')))
+    customer_phone = escape(str(customer_info.get('phone', 'Not provided')))
     shipping = customer_info.get('shippingAddress', {})
     items = order.get('items', [])
     total = float(order.get('total', 0))
@@ -178,17 +182,17 @@ def get_staff_notification_html(order: Dict[str, Any]) -> str:
         address_lines.append(shipping.get('apartment'))
     address_lines.append(f"{shipping.get('city', '')}, {shipping.get('state', '')} {shipping.get('zip', '')}")
     address_lines.append(shipping.get('country', 'USA'))
-    address_html = '<br>'.join(filter(None, address_lines))
+    address_html = '<br>'.join(escape(str(line)) for line in filter(None, address_lines))
 
     # Build items table
     items_html = ""
     for i, item in enumerate(items, 1):
-        product_type = item.get('productType', '').replace('_', ' ').title()
-        size = item.get('size', '')
-        quantity = item.get('quantity', 0)
+        product_type = escape(str(item.get('productType', '')).replace('_', ' ').title())
+        size = escape(str(item.get('size', '')))
+        quantity = escape(str(item.get('quantity', 0)))
         total_price = float(item.get('totalPrice', 0))
-        artwork_url = item.get('artworkUrl', item.get('artworkS3Url', ''))
-        instructions = item.get('instructions', '') or 'None'
+        artwork_url = escape(str(item.get('artworkUrl', item.get('artworkS3Url', ''))))
+        instructions = escape(str(item.get('instructions', '') or 'None'))
 
         items_html += f"""
             <tr>
@@ -249,15 +253,15 @@ def get_staff_notification_html(order: Dict[str, Any]) -> str:
                         <table style="width: 100%;">
                             <tr>
                                 <td style="padding: 8px 0;"><strong>Name:</strong></td>
-                                <td>{customer_info.get('name', 'N/A')}</td>
+                                <td>{customer_name}</td>
                             </tr>
                             <tr>
                                 <td style="padding: 8px 0;"><strong>Email:</strong></td>
-                                <td><a href="mailto:{customer_info.get('email', '')}" style="color: {BRAND_PRIMARY};">{customer_info.get('email', 'N/A')}</a></td>
+                                <td><a href="mailto:{customer_email}" style="color: {BRAND_PRIMARY};">{customer_email or 'N/A'}</a></td>
                             </tr>
                             <tr>
                                 <td style="padding: 8px 0;"><strong>Phone:</strong></td>
-                                <td>{customer_info.get('phone', 'Not provided')}</td>
+                                <td>{customer_phone}</td>
                             </tr>
                         </table>
                     </td>
@@ -281,193 +281,6 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         }
 
 
-# Inline email templates for Lambda deployment (in case import fails)
-def get_customer_confirmation_html(order: Dict) -> str:
-    """Generate customer confirmation email HTML."""
-    order_id = order.get('orderId', '')
-    customer_name = order.get('customerInfo', {}).get('name', 'Customer')
-    order_date = order.get('orderDate', '')[:10]
-    total = float(order.get('total', 0))
-    items = order.get('items', [])
-
-    items_html = ""
-    for item in items:
-        items_html += f"""
-        <tr>
-            <td style="padding: 12px; border-bottom: 1px solid #eee;">{item.get('productType', '')}</td>
-            <td style="padding: 12px; border-bottom: 1px solid #eee;">{item.get('size', '')}</td>
-            <td style="padding: 12px; border-bottom: 1px solid #eee; text-align: center;">{item.get('quantity', 0)}</td>
-            <td style="padding: 12px; border-bottom: 1px solid #eee; text-align: right;">${float(item.get('totalPrice', 0)):.2f}</td>
-        </tr>
-        """
-
-    return f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <div style="text-align: center; padding: 20px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 10px 10px 0 0;">
-            <h1 style="color: white; margin: 0;">Sticker & Magnet Lab</h1>
-            <p style="color: rgba(255,255,255,0.9); margin: 5px 0 0 0;">Order Confirmation</p>
-        </div>
-
-        <div style="background: #fff; padding: 30px; border: 1px solid #e0e0e0; border-top: none;">
-            <h2 style="color: #333; margin-top: 0;">Thank you for your order, {customer_name}!</h2>
-
-            <p>We've received your order and it's being processed. Here are your order details:</p>
-
-            <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin: 20px 0;">
-                <p style="margin: 5px 0;"><strong>Order ID:</strong> {order_id}</p>
-                <p style="margin: 5px 0;"><strong>Order Date:</strong> {order_date}</p>
-            </div>
-
-            <h3 style="border-bottom: 2px solid #667eea; padding-bottom: 10px;">Order Items</h3>
-
-            <table style="width: 100%; border-collapse: collapse;">
-                <thead>
-                    <tr style="background: #f8f9fa;">
-                        <th style="padding: 12px; text-align: left;">Product</th>
-                        <th style="padding: 12px; text-align: left;">Size</th>
-                        <th style="padding: 12px; text-align: center;">Qty</th>
-                        <th style="padding: 12px; text-align: right;">Price</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {items_html}
-                </tbody>
-                <tfoot>
-                    <tr>
-                        <td colspan="3" style="padding: 12px; text-align: right; font-weight: bold;">Total:</td>
-                        <td style="padding: 12px; text-align: right; font-weight: bold; color: #667eea; font-size: 18px;">${total:.2f}</td>
-                    </tr>
-                </tfoot>
-            </table>
-
-            <div style="background: #fff3cd; border: 1px solid #ffc107; padding: 15px; border-radius: 8px; margin: 20px 0;">
-                <p style="margin: 0; color: #856404;">
-                    <strong>Production Time:</strong> Your order will be ready within 3-5 business days.
-                    You will receive a notification when your order ships.
-                </p>
-            </div>
-
-            <p>If you have any questions about your order, please don't hesitate to contact us.</p>
-
-            <div style="text-align: center; margin-top: 30px; padding-top: 20px; border-top: 1px solid #eee;">
-                <p style="color: #666; font-size: 14px;">
-                    Thank you for choosing Sticker & Magnet Lab!<br>
-                    <a href="mailto:orders@rrinconline.com" style="color: #667eea;">orders@rrinconline.com</a>
-                </p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-
-
-def get_staff_notification_html(order: Dict) -> str:
-    """Generate staff notification email HTML."""
-    order_id = order.get('orderId', '')
-    order_date = order.get('orderDate', '')
-    customer_info = order.get('customerInfo', {})
-    shipping = customer_info.get('shippingAddress', {})
-    total = float(order.get('total', 0))
-    items = order.get('items', [])
-
-    items_html = ""
-    for item in items:
-        artwork_url = item.get('artworkUrl', item.get('artworkS3Url', ''))
-        instructions = item.get('instructions', 'None')
-
-        items_html += f"""
-        <tr>
-            <td style="padding: 12px; border: 1px solid #ddd;">{item.get('productType', '')}</td>
-            <td style="padding: 12px; border: 1px solid #ddd;">{item.get('size', '')}</td>
-            <td style="padding: 12px; border: 1px solid #ddd; text-align: center;">{item.get('quantity', 0)}</td>
-            <td style="padding: 12px; border: 1px solid #ddd; text-align: right;">${float(item.get('totalPrice', 0)):.2f}</td>
-            <td style="padding: 12px; border: 1px solid #ddd;">
-                <a href="{artwork_url}" target="_blank" style="color: #007bff;">Download Artwork</a>
-            </td>
-            <td style="padding: 12px; border: 1px solid #ddd; font-size: 12px;">{instructions}</td>
-        </tr>
-        """
-
-    return f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px;">
-        <div style="background: #dc3545; color: white; padding: 15px 20px; border-radius: 5px 5px 0 0;">
-            <h1 style="margin: 0; font-size: 24px;">NEW ORDER RECEIVED</h1>
-        </div>
-
-        <div style="background: #fff; padding: 20px; border: 1px solid #ddd; border-top: none;">
-            <div style="background: #f8f9fa; padding: 15px; border-radius: 5px; margin-bottom: 20px;">
-                <h2 style="margin: 0 0 10px 0; color: #333;">Order #{order_id}</h2>
-                <p style="margin: 0; color: #666;">Received: {order_date}</p>
-            </div>
-
-            <h3 style="color: #333; border-bottom: 2px solid #007bff; padding-bottom: 10px;">Customer Information</h3>
-            <table style="width: 100%; margin-bottom: 20px;">
-                <tr>
-                    <td style="padding: 8px 0;"><strong>Name:</strong></td>
-                    <td>{customer_info.get('name', '')}</td>
-                </tr>
-                <tr>
-                    <td style="padding: 8px 0;"><strong>Email:</strong></td>
-                    <td><a href="mailto:{customer_info.get('email', '')}">{customer_info.get('email', '')}</a></td>
-                </tr>
-                <tr>
-                    <td style="padding: 8px 0;"><strong>Phone:</strong></td>
-                    <td>{customer_info.get('phone', 'Not provided')}</td>
-                </tr>
-            </table>
-
-            <h3 style="color: #333; border-bottom: 2px solid #007bff; padding-bottom: 10px;">Shipping Address</h3>
-            <div style="background: #f8f9fa; padding: 15px; border-radius: 5px; margin-bottom: 20px;">
-                <p style="margin: 0;">
-                    {shipping.get('street', '')}<br>
-                    {shipping.get('apartment', '') + '<br>' if shipping.get('apartment') else ''}
-                    {shipping.get('city', '')}, {shipping.get('state', '')} {shipping.get('zip', '')}<br>
-                    {shipping.get('country', 'USA')}
-                </p>
-            </div>
-
-            <h3 style="color: #333; border-bottom: 2px solid #007bff; padding-bottom: 10px;">Order Items</h3>
-            <table style="width: 100%; border-collapse: collapse; margin-bottom: 20px;">
-                <thead>
-                    <tr style="background: #343a40; color: white;">
-                        <th style="padding: 12px; text-align: left;">Product</th>
-                        <th style="padding: 12px; text-align: left;">Size</th>
-                        <th style="padding: 12px; text-align: center;">Qty</th>
-                        <th style="padding: 12px; text-align: right;">Price</th>
-                        <th style="padding: 12px; text-align: left;">Artwork</th>
-                        <th style="padding: 12px; text-align: left;">Instructions</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {items_html}
-                </tbody>
-            </table>
-
-            <div style="background: #28a745; color: white; padding: 15px; border-radius: 5px; text-align: right;">
-                <span style="font-size: 18px;">Order Total: </span>
-                <span style="font-size: 24px; font-weight: bold;">${total:.2f}</span>
-            </div>
-
-            <p style="margin-top: 20px; padding: 15px; background: #fff3cd; border-radius: 5px; color: #856404;">
-                <strong>Note:</strong> Artwork links are valid for 7 days. Please download promptly.
-            </p>
-        </div>
-    </body>
-    </html>
-    """
-
-
 # For local testing
 if __name__ == '__main__':
     test_order = {
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+SES Template Setup Script for Sticker & Magnet Lab.
+
+Run locally with AWS credentials:
+    python ses_setup.py
+
+Creates (or updates) the SES templates used by the Lambda functions.
+
+Templates created:
+    1. ContactFormEmail - Passthrough template used by contact_form to send
+       the staff notification and customer auto-reply in a single
+       SendBulkTemplatedEmail call. Subject and bodies are supplied entirely
+       through each destination's ReplacementTemplateData.
+"""
+
+import sys
+from typing import Any, Dict
+
+import boto3
+from botocore.exceptions import ClientError
+
+# Configuration
+AWS_REGION = 'us-east-1'
+
+# Template definitions
+TEMPLATES = {
+    'contact_form': {
+        'TemplateName': 'ContactFormEmail',
+        'SubjectPart': '{{{subject}}}',
+        'HtmlPart': '{{{html}}}',
+        'TextPart': '{{{text}}}'
+    }
+}
+
+# Initialize SES client
+ses_client = boto3.client('ses', region_name=AWS_REGION)
+
+
+def print_header(message: str) -> None:
+    """Print a formatted header message."""
+    print(f"\n{'='*60}")
+    print(f"  {message}")
+    print(f"{'='*60}")
+
+
+def print_status(message: str, status: str = 'INFO') -> None:
+    """Print a status message."""
+    symbols = {
+        'INFO': '[*]',
+        'SUCCESS': '[+]',
+        'ERROR': '[-]'
+    }
+    print(f"{symbols.get(status, '[*]')} {message}")
+
+
+def upsert_template(template: Dict[str, Any]) -> bool:
+    """
+    Create an SES template, updating it if it already exists.
+
+    Args:
+        template: SES template definition
+
+    Returns:
+        True if the template was created or updated
+    """
+    template_name = template['TemplateName']
+
+    try:
+        ses_client.create_template(Template=template)
+        print_status(f"Template {template_name} created", 'SUCCESS')
+        return True
+
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'AlreadyExists':
+            print_status(f"Error creating {template_name}: {e.response['Error']['Message']}", 'ERROR')
+            return False
+
+    try:
+        ses_client.update_template(Template=template)
+        print_status(f"Template {template_name} updated", 'SUCCESS')
+        return True
+
+    except ClientError as e:
+        print_status(f"Error updating {template_name}: {e.response['Error']['Message']}", 'ERROR')
+        return False
+
+
+def main():
+    """Main entry point for SES template setup."""
+    print_header("Sticker & Magnet Lab - SES Template Setup")
+    print(f"AWS Region: {AWS_REGION}")
+
+    results = [upsert_template(template) for template in TEMPLATES.values()]
+
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
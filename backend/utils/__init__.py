@@ -6,12 +6,18 @@ from .email_templates import (
     get_customer_confirmation_html,
     get_staff_notification_html,
     get_contact_auto_reply_html,
-    get_contact_notification_html
+    get_contact_notification_html,
+    iter_customer_confirmation_html,
+    iter_staff_notification_html,
+    clear_render_cache
 )
 
 __all__ = [
     'get_customer_confirmation_html',
     'get_staff_notification_html',
     'get_contact_auto_reply_html',
-    'get_contact_notification_html'
+    'get_contact_notification_html',
+    'iter_customer_confirmation_html',
+    'iter_staff_notification_html',
+    'clear_render_cache'
 ]
@@ -8,7 +8,13 @@ Templates included:
 - Contact form notification (staff)
 """
 
-from typing import Any, Dict, List
+import re
+from datetime import datetime
+from functools import lru_cache
+from html import escape
+from string import Formatter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 
 
 # Company branding colors
@@ -19,15 +25,35 @@ BRAND_WARNING = '#ffc107'
 BRAND_DANGER = '#dc3545'
 BRAND_INFO = '#17a2b8'
 
-
-def get_base_styles() -> str:
-    """
-    Get common base CSS styles for all emails.
-
-    Returns:
-        CSS style string
-    """
-    return """
+# Display labels for the product types used by the storefront and pricing API
+# (fallback for anything else: underscores to spaces, title case)
+_PRODUCT_LABELS = {
+    'stickers': 'Stickers',
+    'sticker': 'Sticker',
+    'die_cut_sticker': 'Die Cut Sticker',
+    'die_cut_magnets': 'Die Cut Magnets',
+    'fridge_magnets': 'Fridge Magnets',
+    'magnet': 'Magnet'
+}
+
+_HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+
+# Shared empty default for missing nested dicts (never mutated)
+_EMPTY: Dict[str, Any] = {}
+
+# Brand palette as a single template field ({brand[primary]} etc.)
+_BRAND = MappingProxyType({
+    'primary': BRAND_PRIMARY,
+    'secondary': BRAND_SECONDARY,
+    'success': BRAND_SUCCESS,
+    'warning': BRAND_WARNING,
+    'danger': BRAND_DANGER,
+    'info': BRAND_INFO
+})
+
+
+# Common base CSS styles (built once; the templates inline their own styles)
+_BASE_STYLES = """
     <style>
         body {
             font-family: 'Segoe UI', Arial, sans-serif;
@@ -122,6 +148,32 @@ def get_base_styles() -> str:
     """
 
 
+def get_base_styles() -> str:
+    """
+    Get common base CSS styles for all emails.
+
+    Returns:
+        CSS style string
+    """
+    return _BASE_STYLES
+
+
+@lru_cache(maxsize=8192)
+def _format_cents(cents: int) -> str:
+    """
+    Format an integer number of cents as USD (cached; cents are a small space).
+
+    Args:
+        cents: Amount in cents
+
+    Returns:
+        Formatted currency string
+    """
+    sign = '-' if cents < 0 else ''
+    cents = abs(cents)
+    return f"${sign}{cents // 100:,}.{cents % 100:02d}"
+
+
 def format_currency(amount: float) -> str:
     """
     Format a number as USD currency.
@@ -132,57 +184,195 @@ def format_currency(amount: float) -> str:
     Returns:
         Formatted currency string
     """
+    if not isinstance(amount, (int, float)):
+        try:
+            amount = float(amount)
+        except (ValueError, TypeError):
+            return "$0.00"
+
     try:
-        return f"${float(amount):,.2f}"
-    except (ValueError, TypeError):
+        # Round to cents first so halves match f"{amount:.2f}" exactly
+        return _format_cents(int(round(round(amount, 2) * 100)))
+    except (ValueError, OverflowError):
+        # NaN / infinity
         return "$0.00"
 
 
-def get_customer_confirmation_html(order: Dict[str, Any]) -> str:
+def _format_order_date(order_date: Any) -> str:
     """
-    Generate HTML for customer order confirmation email.
+    Format an ISO order timestamp as its YYYY-MM-DD date.
 
     Args:
-        order: Order data dictionary containing:
-            - orderId: Order identifier
-            - orderDate: ISO timestamp
-            - customerInfo: Customer details including name
-            - items: List of order items
-            - subtotal: Order subtotal
-            - shipping: Shipping cost
-            - total: Order total
+        order_date: ISO timestamp (e.g. 2024-01-15T10:30:00.123456Z)
 
     Returns:
-        Complete HTML email body
+        Date string, or '' if the timestamp is missing or malformed
     """
-    order_id = order.get('orderId', 'N/A')
-    customer_name = order.get('customerInfo', {}).get('name', 'Valued Customer')
-    order_date = order.get('orderDate', '')[:10]
-    items = order.get('items', [])
-    subtotal = float(order.get('subtotal', 0))
-    shipping = float(order.get('shipping', 0))
-    total = float(order.get('total', 0))
+    if not isinstance(order_date, str):
+        return ''
 
-    # Build items table rows
-    items_html = ""
-    for item in items:
-        product_type = item.get('productType', '').replace('_', ' ').title()
-        size = item.get('size', '')
-        quantity = item.get('quantity', 0)
-        total_price = float(item.get('totalPrice', 0))
+    try:
+        return datetime.fromisoformat(order_date).date().isoformat()
+    except ValueError:
+        return ''
+
+
+def clear_render_cache() -> None:
+    """Clear the cached rendered emails (mainly for tests)."""
+    _render_contact_auto_reply.cache_clear()
+
+
+def _escape_fields(fields: Dict[str, Any], **markup: str) -> Dict[str, str]:
+    """
+    HTML-escape the user-supplied template fields in one pass.
+
+    Args:
+        fields: Template fields; every value is converted to str and escaped
+        **markup: Pre-rendered HTML fragments added without escaping
+
+    Returns:
+        Fields safe to substitute into the HTML templates
+    """
+    escaped = {key: escape(str(value)) for key, value in fields.items()}
+    escaped.update(markup)
+    return escaped
+
+
+class _PartialFields(dict):
+    """format_map mapping that leaves placeholders it doesn't know untouched."""
+
+    def __missing__(self, key: str) -> str:
+        return '{' + key + '}'
+
+
+def _compose(template: str, **static: str) -> str:
+    """
+    Fill the brand colors and static chrome of a template at import time.
+
+    Per-email placeholders are left in place for format_map at render time.
+
+    Args:
+        template: Template source
+        **static: Static values (chrome fragments, titles) by placeholder name
+
+    Returns:
+        Template with only per-email placeholders remaining
+    """
+    return template.format_map(_PartialFields(static, brand=_BRAND))
+
+
+def _minify_html(template: str) -> str:
+    """
+    Drop source indentation, blank lines and HTML comments from a template.
+
+    Runs once at import. Line breaks are kept (as single newlines) so text
+    wrapped across source lines still has a space between words. Per-email
+    values such as pre-wrap messages are substituted later and untouched.
+
+    Args:
+        template: HTML template source
+
+    Returns:
+        Minified template
+    """
+    template = _HTML_COMMENT_RE.sub('', template)
+    return '\n'.join(line.strip() for line in template.splitlines() if line.strip())
+
+
+def _compile_template(template: str) -> Callable[[Dict[str, Any]], Tuple[str, ...]]:
+    """
+    Compile a str.format template into a straight-line render function.
+
+    The template is parsed once at import and turned into generated Python
+    source of the form ``(_L0, str(f['name']), _L1, ...)``, so rendering
+    runs no parsing, loops or template-engine dispatch. The chunks are
+    returned unjoined; static chunks are shared by every render.
+
+    Args:
+        template: Template with plain {field} placeholders
+
+    Returns:
+        Function mapping a dict of field values to the rendered chunks
+
+    Raises:
+        ValueError: If a placeholder has a format spec or conversion
+    """
+    namespace: Dict[str, Any] = {}
+    pieces = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        if spec or conversion:
+            raise ValueError(f"Unsupported format spec or conversion in template field {field!r}")
+        if literal:
+            name = f'_L{len(namespace)}'
+            namespace[name] = literal
+            pieces.append(name)
+        if field is not None:
+            pieces.append(f'str(f[{field!r}])')
+
+    source = f"def render(f):\n    return ({', '.join(pieces)},)\n"
+    exec(compile(source, '<email template>', 'exec'), namespace)
+    return namespace['render']
+
+
+def _compile_around(template: str, field: str) -> Tuple[Callable[[Dict[str, Any]], Tuple[str, ...]], ...]:
+    """
+    Compile the parts of a template before and after a streamed placeholder.
+
+    Args:
+        template: Template containing {field} exactly once
+        field: Placeholder whose content is yielded separately
+
+    Returns:
+        (head, tail) render functions
+    """
+    parts = template.split('{' + field + '}')
+    if len(parts) != 2:
+        raise ValueError(f"Template must contain {{{field}}} exactly once")
+    return tuple(_compile_template(part) for part in parts)
+
+
+# Shared email chrome, filled into the templates once at import
+_BODY_OPEN_HTML = '''<body style="font-family: 'Segoe UI', Arial, sans-serif; line-height: 1.6; color: #333; margin: 0; padding: 0; background-color: #f5f5f5;">'''
+
+_BRAND_HEADER_HTML = """        <!-- Header -->
+        <div style="text-align: center; padding: 30px 20px; background: linear-gradient(135deg, {brand[primary]} 0%, {brand[secondary]} 100%); border-radius: 10px 10px 0 0;">
+            <h1 style="color: white; margin: 0; font-size: 28px; font-weight: 600;">Sticker & Magnet Lab</h1>
+            <p style="color: rgba(255,255,255,0.9); margin: 10px 0 0 0; font-size: 16px;">{subtitle}</p>
+        </div>"""
 
-        items_html += f"""
+_CUSTOMER_FOOTER_HTML = """        <!-- Footer -->
+        <div style="text-align: center; padding: 25px; background: #ffffff; border: 1px solid #e0e0e0; border-top: none; border-radius: 0 0 10px 10px;">
+            <p style="color: #666; font-size: 14px; margin: 0;">
+                Thank you for choosing Sticker & Magnet Lab!<br>
+                <a href="mailto:orders@rrinconline.com" style="color: {brand[primary]};">orders@rrinconline.com</a>
+            </p>
+            <p style="color: #999; font-size: 12px; margin: 15px 0 0 0;">
+                {footer_note}
+            </p>
+        </div>"""
+
+_STAFF_FOOTER_HTML = """        <!-- Footer -->
+        <div style="text-align: center; padding: 15px; color: #666; font-size: 12px;">
+            <p>This notification was sent to staff members at Sticker & Magnet Lab</p>
+        </div>"""
+
+
+# Email templates are defined and compiled once at import. Rendering only
+# evaluates the per-email placeholders. Order templates are compiled as a
+# head and tail around the item rows so iter_*_html can stream them.
+_CUSTOMER_ITEM_ROW_TMPL = """
             <tr>
                 <td style="padding: 15px; border-bottom: 1px solid #eee;">
                     <strong>{product_type}</strong><br>
                     <span style="color: #666; font-size: 14px;">Size: {size}</span>
                 </td>
                 <td style="padding: 15px; border-bottom: 1px solid #eee; text-align: center;">{quantity}</td>
-                <td style="padding: 15px; border-bottom: 1px solid #eee; text-align: right;">{format_currency(total_price)}</td>
+                <td style="padding: 15px; border-bottom: 1px solid #eee; text-align: right;">{total_price}</td>
             </tr>
         """
+_CUSTOMER_ITEM_ROW_RENDER = _compile_template(_minify_html(_CUSTOMER_ITEM_ROW_TMPL))
 
-    return f"""
+_CUSTOMER_CONFIRMATION_TMPL = _compose("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -190,13 +380,9 @@ def get_customer_confirmation_html(order: Dict[str, Any]) -> str:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Order Confirmation - {order_id}</title>
 </head>
-<body style="font-family: 'Segoe UI', Arial, sans-serif; line-height: 1.6; color: #333; margin: 0; padding: 0; background-color: #f5f5f5;">
+{body_open}
     <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-        <!-- Header -->
-        <div style="text-align: center; padding: 30px 20px; background: linear-gradient(135deg, {BRAND_PRIMARY} 0%, {BRAND_SECONDARY} 100%); border-radius: 10px 10px 0 0;">
-            <h1 style="color: white; margin: 0; font-size: 28px; font-weight: 600;">Sticker & Magnet Lab</h1>
-            <p style="color: rgba(255,255,255,0.9); margin: 10px 0 0 0; font-size: 16px;">Order Confirmation</p>
-        </div>
+{header}
 
         <!-- Content -->
         <div style="background: #ffffff; padding: 30px; border: 1px solid #e0e0e0; border-top: none;">
@@ -209,7 +395,7 @@ def get_customer_confirmation_html(order: Dict[str, Any]) -> str:
                 <table style="width: 100%;">
                     <tr>
                         <td style="padding: 5px 0;"><strong>Order Number:</strong></td>
-                        <td style="padding: 5px 0; text-align: right; color: {BRAND_PRIMARY}; font-weight: 600;">{order_id}</td>
+                        <td style="padding: 5px 0; text-align: right; color: {brand[primary]}; font-weight: 600;">{order_id}</td>
                     </tr>
                     <tr>
                         <td style="padding: 5px 0;"><strong>Order Date:</strong></td>
@@ -219,7 +405,7 @@ def get_customer_confirmation_html(order: Dict[str, Any]) -> str:
             </div>
 
             <!-- Order Items -->
-            <h3 style="color: #333; border-bottom: 3px solid {BRAND_PRIMARY}; padding-bottom: 10px; margin-top: 30px;">Order Items</h3>
+            <h3 style="color: #333; border-bottom: 3px solid {brand[primary]}; padding-bottom: 10px; margin-top: 30px;">Order Items</h3>
 
             <table style="width: 100%; border-collapse: collapse;">
                 <thead>
@@ -239,15 +425,15 @@ def get_customer_confirmation_html(order: Dict[str, Any]) -> str:
                 <table style="width: 100%;">
                     <tr>
                         <td style="padding: 8px 0;">Subtotal:</td>
-                        <td style="padding: 8px 0; text-align: right;">{format_currency(subtotal)}</td>
+                        <td style="padding: 8px 0; text-align: right;">{subtotal}</td>
                     </tr>
                     <tr>
                         <td style="padding: 8px 0;">Shipping:</td>
-                        <td style="padding: 8px 0; text-align: right;">{format_currency(shipping) if shipping > 0 else 'FREE'}</td>
+                        <td style="padding: 8px 0; text-align: right;">{shipping}</td>
                     </tr>
                     <tr style="border-top: 2px solid #ddd;">
                         <td style="padding: 12px 0; font-size: 18px;"><strong>Total:</strong></td>
-                        <td style="padding: 12px 0; text-align: right; font-size: 22px; color: {BRAND_PRIMARY}; font-weight: 700;">{format_currency(total)}</td>
+                        <td style="padding: 12px 0; text-align: right; font-size: 22px; color: {brand[primary]}; font-weight: 700;">{total}</td>
                     </tr>
                 </table>
             </div>
@@ -264,65 +450,104 @@ def get_customer_confirmation_html(order: Dict[str, Any]) -> str:
             <p style="font-size: 16px;">If you have any questions about your order, please don't hesitate to contact us.</p>
         </div>
 
-        <!-- Footer -->
-        <div style="text-align: center; padding: 25px; background: #ffffff; border: 1px solid #e0e0e0; border-top: none; border-radius: 0 0 10px 10px;">
-            <p style="color: #666; font-size: 14px; margin: 0;">
-                Thank you for choosing Sticker & Magnet Lab!<br>
-                <a href="mailto:orders@rrinconline.com" style="color: {BRAND_PRIMARY};">orders@rrinconline.com</a>
-            </p>
-            <p style="color: #999; font-size: 12px; margin: 15px 0 0 0;">
-                This email was sent regarding order {order_id}
-            </p>
-        </div>
+{footer}
     </div>
 </body>
 </html>
-"""
+""",
+    body_open=_BODY_OPEN_HTML,
+    header=_compose(_BRAND_HEADER_HTML, subtitle='Order Confirmation'),
+    footer=_compose(_CUSTOMER_FOOTER_HTML, footer_note='This email was sent regarding order {order_id}')
+)
+_CUSTOMER_CONFIRMATION_HEAD, _CUSTOMER_CONFIRMATION_TAIL = _compile_around(
+    _minify_html(_CUSTOMER_CONFIRMATION_TMPL), 'items_html'
+)
 
 
-def get_staff_notification_html(order: Dict[str, Any]) -> str:
+def iter_customer_confirmation_html(order: Dict[str, Any]) -> Iterator[str]:
     """
-    Generate HTML for staff order notification email.
+    Yield HTML for customer order confirmation email in chunks.
+
+    The page head is yielded first, then each item row as it is rendered,
+    then the order summary and footer.
 
     Args:
-        order: Order data dictionary containing full order details
-            including customer info, shipping address, and items with artwork URLs
+        order: Order data dictionary containing:
+            - orderId: Order identifier
+            - orderDate: ISO timestamp
+            - customerInfo: Customer details including name
+            - items: List of order items
+            - subtotal: Order subtotal
+            - shipping: Shipping cost
+            - total: Order total
 
-    Returns:
-        Complete HTML email body for staff
+    Yields:
+        Chunks of the HTML email body
     """
     order_id = order.get('orderId', 'N/A')
-    order_date = order.get('orderDate', '')
-    customer_info = order.get('customerInfo', {})
-    shipping = customer_info.get('shippingAddress', {})
+    customer_info = order.get('customerInfo') or _EMPTY
+    customer_name = customer_info.get('name', 'Valued Customer')
+    order_date = _format_order_date(order.get('orderDate'))
     items = order.get('items', [])
+    subtotal = float(order.get('subtotal', 0))
+    shipping = float(order.get('shipping', 0))
     total = float(order.get('total', 0))
 
-    # Format address
-    address_lines = [shipping.get('street', '')]
-    if shipping.get('apartment'):
-        address_lines.append(shipping.get('apartment'))
-    address_lines.append(f"{shipping.get('city', '')}, {shipping.get('state', '')} {shipping.get('zip', '')}")
-    address_lines.append(shipping.get('country', 'USA'))
-    address_html = '<br>'.join(filter(None, address_lines))
-
-    # Build items table
-    items_html = ""
-    for i, item in enumerate(items, 1):
-        product_type = item.get('productType', '').replace('_', ' ').title()
+    fields = _escape_fields({
+        'order_id': order_id,
+        'customer_name': customer_name,
+        'order_date': order_date,
+        'subtotal': format_currency(subtotal),
+        'shipping': format_currency(shipping) if shipping > 0 else 'FREE',
+        'total': format_currency(total)
+    })
+    yield from _CUSTOMER_CONFIRMATION_HEAD(fields)
+
+    # Items table rows
+    for item in items:
+        raw_type = str(item.get('productType', ''))
+        product_type = _PRODUCT_LABELS.get(raw_type) or raw_type.replace('_', ' ').title()
         size = item.get('size', '')
         quantity = item.get('quantity', 0)
         total_price = float(item.get('totalPrice', 0))
-        artwork_url = item.get('artworkUrl', item.get('artworkS3Url', ''))
-        instructions = item.get('instructions', '') or 'None'
 
-        items_html += f"""
+        yield from _CUSTOMER_ITEM_ROW_RENDER(_escape_fields({
+            'product_type': product_type,
+            'size': size,
+            'quantity': quantity,
+            'total_price': format_currency(total_price)
+        }))
+
+    yield from _CUSTOMER_CONFIRMATION_TAIL(fields)
+
+
+def get_customer_confirmation_html(order: Dict[str, Any]) -> str:
+    """
+    Generate HTML for customer order confirmation email.
+
+    Args:
+        order: Order data dictionary containing:
+            - orderId: Order identifier
+            - orderDate: ISO timestamp
+            - customerInfo: Customer details including name
+            - items: List of order items
+            - subtotal: Order subtotal
+            - shipping: Shipping cost
+            - total: Order total
+
+    Returns:
+        Complete HTML email body
+    """
+    return ''.join(iter_customer_confirmation_html(order))
+
+
+_STAFF_ITEM_ROW_TMPL = """
             <tr>
-                <td style="padding: 12px; border: 1px solid #ddd; text-align: center;">{i}</td>
+                <td style="padding: 12px; border: 1px solid #ddd; text-align: center;">{index}</td>
                 <td style="padding: 12px; border: 1px solid #ddd;">{product_type}</td>
                 <td style="padding: 12px; border: 1px solid #ddd; text-align: center;">{size}</td>
                 <td style="padding: 12px; border: 1px solid #ddd; text-align: center;">{quantity}</td>
-                <td style="padding: 12px; border: 1px solid #ddd; text-align: right;">{format_currency(total_price)}</td>
+                <td style="padding: 12px; border: 1px solid #ddd; text-align: right;">{total_price}</td>
                 <td style="padding: 12px; border: 1px solid #ddd;">
                     <a href="{artwork_url}" target="_blank" style="color: #007bff; font-weight: 600;">Download</a>
                 </td>
@@ -333,18 +558,19 @@ def get_staff_notification_html(order: Dict[str, Any]) -> str:
                 </td>
             </tr>
         """
+_STAFF_ITEM_ROW_RENDER = _compile_template(_minify_html(_STAFF_ITEM_ROW_TMPL))
 
-    return f"""
+_STAFF_NOTIFICATION_TMPL = _compose("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <title>New Order - {order_id}</title>
 </head>
-<body style="font-family: 'Segoe UI', Arial, sans-serif; line-height: 1.6; color: #333; margin: 0; padding: 0; background-color: #f5f5f5;">
+{body_open}
     <div style="max-width: 800px; margin: 0 auto; padding: 20px;">
         <!-- Alert Header -->
-        <div style="background: {BRAND_DANGER}; color: white; padding: 20px; border-radius: 5px 5px 0 0; text-align: center;">
+        <div style="background: {brand[danger]}; color: white; padding: 20px; border-radius: 5px 5px 0 0; text-align: center;">
             <h1 style="margin: 0; font-size: 24px;">NEW ORDER RECEIVED</h1>
             <p style="margin: 10px 0 0 0; font-size: 18px; opacity: 0.9;">Action Required</p>
         </div>
@@ -352,7 +578,7 @@ def get_staff_notification_html(order: Dict[str, Any]) -> str:
         <!-- Content -->
         <div style="background: #fff; padding: 25px; border: 1px solid #ddd; border-top: none;">
             <!-- Order Summary Box -->
-            <div style="background: linear-gradient(135deg, {BRAND_PRIMARY} 0%, {BRAND_SECONDARY} 100%); color: white; padding: 20px; border-radius: 8px; margin-bottom: 25px;">
+            <div style="background: linear-gradient(135deg, {brand[primary]} 0%, {brand[secondary]} 100%); color: white; padding: 20px; border-radius: 8px; margin-bottom: 25px;">
                 <table style="width: 100%;">
                     <tr>
                         <td>
@@ -360,7 +586,7 @@ def get_staff_notification_html(order: Dict[str, Any]) -> str:
                             <p style="margin: 5px 0 0 0; opacity: 0.9;">Received: {order_date}</p>
                         </td>
                         <td style="text-align: right;">
-                            <span style="font-size: 28px; font-weight: 700;">{format_currency(total)}</span>
+                            <span style="font-size: 28px; font-weight: 700;">{total}</span>
                         </td>
                     </tr>
                 </table>
@@ -371,25 +597,25 @@ def get_staff_notification_html(order: Dict[str, Any]) -> str:
                 <tr>
                     <td style="width: 50%; vertical-align: top; padding-right: 15px;">
                         <!-- Customer Info -->
-                        <h3 style="color: #333; border-bottom: 3px solid {BRAND_INFO}; padding-bottom: 10px; margin-top: 0;">Customer Information</h3>
+                        <h3 style="color: #333; border-bottom: 3px solid {brand[info]}; padding-bottom: 10px; margin-top: 0;">Customer Information</h3>
                         <table style="width: 100%;">
                             <tr>
                                 <td style="padding: 8px 0;"><strong>Name:</strong></td>
-                                <td>{customer_info.get('name', 'N/A')}</td>
+                                <td>{customer_name}</td>
                             </tr>
                             <tr>
                                 <td style="padding: 8px 0;"><strong>Email:</strong></td>
-                                <td><a href="mailto:{customer_info.get('email', '')}" style="color: {BRAND_PRIMARY};">{customer_info.get('email', 'N/A')}</a></td>
+                                <td><a href="mailto:{customer_email}" style="color: {brand[primary]};">{customer_email_display}</a></td>
                             </tr>
                             <tr>
                                 <td style="padding: 8px 0;"><strong>Phone:</strong></td>
-                                <td>{customer_info.get('phone', 'Not provided')}</td>
+                                <td>{customer_phone}</td>
                             </tr>
                         </table>
                     </td>
                     <td style="width: 50%; vertical-align: top; padding-left: 15px;">
                         <!-- Shipping Address -->
-                        <h3 style="color: #333; border-bottom: 3px solid {BRAND_INFO}; padding-bottom: 10px; margin-top: 0;">Shipping Address</h3>
+                        <h3 style="color: #333; border-bottom: 3px solid {brand[info]}; padding-bottom: 10px; margin-top: 0;">Shipping Address</h3>
                         <div style="background: #f8f9fa; padding: 15px; border-radius: 5px;">
                             {address_html}
                         </div>
@@ -398,7 +624,7 @@ def get_staff_notification_html(order: Dict[str, Any]) -> str:
             </table>
 
             <!-- Order Items -->
-            <h3 style="color: #333; border-bottom: 3px solid {BRAND_INFO}; padding-bottom: 10px;">Order Items</h3>
+            <h3 style="color: #333; border-bottom: 3px solid {brand[info]}; padding-bottom: 10px;">Order Items</h3>
             <table style="width: 100%; border-collapse: collapse; margin-bottom: 20px;">
                 <thead>
                     <tr style="background: #343a40; color: white;">
@@ -416,13 +642,13 @@ def get_staff_notification_html(order: Dict[str, Any]) -> str:
             </table>
 
             <!-- Total Bar -->
-            <div style="background: {BRAND_SUCCESS}; color: white; padding: 20px; border-radius: 5px; text-align: right;">
+            <div style="background: {brand[success]}; color: white; padding: 20px; border-radius: 5px; text-align: right;">
                 <span style="font-size: 18px;">Order Total: </span>
-                <span style="font-size: 28px; font-weight: 700;">{format_currency(total)}</span>
+                <span style="font-size: 28px; font-weight: 700;">{total}</span>
             </div>
 
             <!-- Notes -->
-            <div style="margin-top: 20px; padding: 15px; background: {BRAND_WARNING}20; border-left: 4px solid {BRAND_WARNING}; border-radius: 0 5px 5px 0;">
+            <div style="margin-top: 20px; padding: 15px; background: {brand[warning]}20; border-left: 4px solid {brand[warning]}; border-radius: 0 5px 5px 0;">
                 <p style="margin: 0; color: #856404;">
                     <strong>Important:</strong> Artwork download links are valid for <strong>7 days</strong>.
                     Please download all artwork files promptly.
@@ -430,34 +656,98 @@ def get_staff_notification_html(order: Dict[str, Any]) -> str:
             </div>
         </div>
 
-        <!-- Footer -->
-        <div style="text-align: center; padding: 15px; color: #666; font-size: 12px;">
-            <p>This notification was sent to staff members at Sticker & Magnet Lab</p>
-        </div>
+{footer}
     </div>
 </body>
 </html>
-"""
+""",
+    body_open=_BODY_OPEN_HTML,
+    footer=_STAFF_FOOTER_HTML
+)
+_STAFF_NOTIFICATION_HEAD, _STAFF_NOTIFICATION_TAIL = _compile_around(
+    _minify_html(_STAFF_NOTIFICATION_TMPL), 'items_html'
+)
 
 
-def get_contact_auto_reply_html(contact: Dict[str, Any]) -> str:
+def iter_staff_notification_html(order: Dict[str, Any]) -> Iterator[str]:
     """
-    Generate HTML for contact form auto-reply email.
+    Yield HTML for staff order notification email in chunks.
+
+    The order summary, customer and address section is yielded first, then
+    each item row as it is rendered, then the total and footer.
 
     Args:
-        contact: Contact form data containing:
-            - name: Contact name
-            - subject: Message subject
-            - message: Message content
+        order: Order data dictionary containing full order details
+            including customer info, shipping address, and items with artwork URLs
+
+    Yields:
+        Chunks of the HTML email body for staff
+    """
+    order_id = order.get('orderId', 'N/A')
+    order_date = order.get('orderDate', '')
+    customer_info = order.get('customerInfo') or _EMPTY
+    shipping = customer_info.get('shippingAddress') or _EMPTY
+    items = order.get('items', [])
+    total = float(order.get('total', 0))
+
+    # Format address
+    address_lines = (
+        shipping.get('street', ''),
+        shipping.get('apartment', ''),
+        f"{shipping.get('city', '')}, {shipping.get('state', '')} {shipping.get('zip', '')}",
+        shipping.get('country', 'USA')
+    )
+    address_html = '<br>'.join([escape(str(line)) for line in address_lines if line])
+
+    fields = _escape_fields({
+        'order_id': order_id,
+        'order_date': order_date,
+        'total': format_currency(total),
+        'customer_name': customer_info.get('name', 'N/A'),
+        'customer_email': customer_info.get('email', ''),
+        'customer_email_display': customer_info.get('email', 'N/A'),
+        'customer_phone': customer_info.get('phone', 'Not provided')
+    }, address_html=address_html)
+    yield from _STAFF_NOTIFICATION_HEAD(fields)
+
+    # Items table rows
+    for i, item in enumerate(items, 1):
+        raw_type = str(item.get('productType', ''))
+        product_type = _PRODUCT_LABELS.get(raw_type) or raw_type.replace('_', ' ').title()
+        size = item.get('size', '')
+        quantity = item.get('quantity', 0)
+        total_price = float(item.get('totalPrice', 0))
+        artwork_url = item.get('artworkUrl', item.get('artworkS3Url', ''))
+        instructions = item.get('instructions', '') or 'None'
+
+        yield from _STAFF_ITEM_ROW_RENDER(_escape_fields({
+            'index': i,
+            'product_type': product_type,
+            'size': size,
+            'quantity': quantity,
+            'total_price': format_currency(total_price),
+            'artwork_url': artwork_url,
+            'instructions': instructions
+        }))
+
+    yield from _STAFF_NOTIFICATION_TAIL(fields)
+
+
+def get_staff_notification_html(order: Dict[str, Any]) -> str:
+    """
+    Generate HTML for staff order notification email.
+
+    Args:
+        order: Order data dictionary containing full order details
+            including customer info, shipping address, and items with artwork URLs
 
     Returns:
-        Complete HTML email body
+        Complete HTML email body for staff
     """
-    name = contact.get('name', 'Customer')
-    subject = contact.get('subject', 'General Inquiry')
-    message = contact.get('message', '')
+    return ''.join(iter_staff_notification_html(order))
+
 
-    return f"""
+_CONTACT_AUTO_REPLY_TMPL = _compose("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -465,13 +755,9 @@ def get_contact_auto_reply_html(contact: Dict[str, Any]) -> str:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Thank You for Contacting Us</title>
 </head>
-<body style="font-family: 'Segoe UI', Arial, sans-serif; line-height: 1.6; color: #333; margin: 0; padding: 0; background-color: #f5f5f5;">
+{body_open}
     <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-        <!-- Header -->
-        <div style="text-align: center; padding: 30px 20px; background: linear-gradient(135deg, {BRAND_PRIMARY} 0%, {BRAND_SECONDARY} 100%); border-radius: 10px 10px 0 0;">
-            <h1 style="color: white; margin: 0; font-size: 28px; font-weight: 600;">Sticker & Magnet Lab</h1>
-            <p style="color: rgba(255,255,255,0.9); margin: 10px 0 0 0; font-size: 16px;">We've Received Your Message</p>
-        </div>
+{header}
 
         <!-- Content -->
         <div style="background: #ffffff; padding: 30px; border: 1px solid #e0e0e0; border-top: none;">
@@ -486,7 +772,7 @@ def get_contact_auto_reply_html(contact: Dict[str, Any]) -> str:
             <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; margin: 25px 0;">
                 <h3 style="margin: 0 0 15px 0; color: #555;">Your Message Summary:</h3>
                 <p style="margin: 5px 0;"><strong>Subject:</strong> {subject}</p>
-                <div style="margin-top: 15px; padding: 15px; background: white; border-radius: 5px; border-left: 4px solid {BRAND_PRIMARY};">
+                <div style="margin-top: 15px; padding: 15px; background: white; border-radius: 5px; border-left: 4px solid {brand[primary]};">
                     <p style="margin: 0; white-space: pre-wrap;">{message}</p>
                 </div>
             </div>
@@ -506,56 +792,72 @@ def get_contact_auto_reply_html(contact: Dict[str, Any]) -> str:
             </div>
         </div>
 
-        <!-- Footer -->
-        <div style="text-align: center; padding: 25px; background: #ffffff; border: 1px solid #e0e0e0; border-top: none; border-radius: 0 0 10px 10px;">
-            <p style="color: #666; font-size: 14px; margin: 0;">
-                Thank you for choosing Sticker & Magnet Lab!<br>
-                <a href="mailto:orders@rrinconline.com" style="color: {BRAND_PRIMARY};">orders@rrinconline.com</a>
-            </p>
-            <p style="color: #999; font-size: 12px; margin: 15px 0 0 0;">
-                This is an automated response. Please do not reply directly to this email.
-            </p>
-        </div>
+{footer}
     </div>
 </body>
 </html>
-"""
+""",
+    body_open=_BODY_OPEN_HTML,
+    header=_compose(_BRAND_HEADER_HTML, subtitle="We've Received Your Message"),
+    footer=_compose(
+        _CUSTOMER_FOOTER_HTML,
+        footer_note='This is an automated response. Please do not reply directly to this email.'
+    )
+)
+_CONTACT_AUTO_REPLY_RENDER = _compile_template(_minify_html(_CONTACT_AUTO_REPLY_TMPL))
+
+
+@lru_cache(maxsize=1024)
+def _render_contact_auto_reply(name: str, subject: str, message: str) -> Tuple[str, ...]:
+    """
+    Render the contact auto-reply HTML (cached on the varying fields).
 
+    Args:
+        name: Contact name
+        subject: Message subject
+        message: Message content
 
-def get_contact_notification_html(contact: Dict[str, Any]) -> str:
+    Returns:
+        HTML email body chunks
     """
-    Generate HTML for staff contact form notification email.
+    return _CONTACT_AUTO_REPLY_RENDER(_escape_fields({
+        'name': name,
+        'subject': subject,
+        'message': message
+    }))
+
+
+def get_contact_auto_reply_html(contact: Dict[str, Any]) -> str:
+    """
+    Generate HTML for contact form auto-reply email.
 
     Args:
         contact: Contact form data containing:
-            - contactId: Contact reference ID
             - name: Contact name
-            - email: Contact email
             - subject: Message subject
             - message: Message content
-            - timestamp: Submission timestamp
 
     Returns:
-        Complete HTML email body for staff
+        Complete HTML email body
     """
-    contact_id = contact.get('contactId', 'N/A')
-    name = contact.get('name', 'Unknown')
-    email = contact.get('email', 'Unknown')
-    subject = contact.get('subject', 'No Subject')
-    message = contact.get('message', '')
-    timestamp = contact.get('timestamp', '')
+    return ''.join(_render_contact_auto_reply(
+        contact.get('name', 'Customer'),
+        contact.get('subject', 'General Inquiry'),
+        contact.get('message', '')
+    ))
+
 
-    return f"""
+_CONTACT_NOTIFICATION_TMPL = _compose("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <title>New Contact Form Submission</title>
 </head>
-<body style="font-family: 'Segoe UI', Arial, sans-serif; line-height: 1.6; color: #333; margin: 0; padding: 0; background-color: #f5f5f5;">
+{body_open}
     <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
         <!-- Header -->
-        <div style="background: {BRAND_INFO}; color: white; padding: 20px; border-radius: 5px 5px 0 0;">
+        <div style="background: {brand[info]}; color: white; padding: 20px; border-radius: 5px 5px 0 0;">
             <h1 style="margin: 0; font-size: 22px;">New Contact Form Submission</h1>
             <p style="margin: 5px 0 0 0; opacity: 0.9;">Received: {timestamp}</p>
         </div>
@@ -573,7 +875,7 @@ def get_contact_notification_html(contact: Dict[str, Any]) -> str:
             </div>
 
             <!-- Contact Information -->
-            <h3 style="color: #333; border-bottom: 3px solid {BRAND_INFO}; padding-bottom: 10px;">Contact Information</h3>
+            <h3 style="color: #333; border-bottom: 3px solid {brand[info]}; padding-bottom: 10px;">Contact Information</h3>
             <table style="width: 100%; margin-bottom: 25px;">
                 <tr>
                     <td style="padding: 10px 0; width: 100px;"><strong>Name:</strong></td>
@@ -582,7 +884,7 @@ def get_contact_notification_html(contact: Dict[str, Any]) -> str:
                 <tr>
                     <td style="padding: 10px 0;"><strong>Email:</strong></td>
                     <td style="padding: 10px 0;">
-                        <a href="mailto:{email}" style="color: {BRAND_PRIMARY};">{email}</a>
+                        <a href="mailto:{email}" style="color: {brand[primary]};">{email}</a>
                     </td>
                 </tr>
                 <tr>
@@ -592,7 +894,7 @@ def get_contact_notification_html(contact: Dict[str, Any]) -> str:
             </table>
 
             <!-- Message -->
-            <h3 style="color: #333; border-bottom: 3px solid {BRAND_INFO}; padding-bottom: 10px;">Message</h3>
+            <h3 style="color: #333; border-bottom: 3px solid {brand[info]}; padding-bottom: 10px;">Message</h3>
             <div style="background: #f8f9fa; padding: 20px; border-radius: 5px; white-space: pre-wrap; margin-bottom: 25px;">
 {message}
             </div>
@@ -600,17 +902,70 @@ def get_contact_notification_html(contact: Dict[str, Any]) -> str:
             <!-- Quick Reply Button -->
             <div style="text-align: center; margin: 25px 0;">
                 <a href="mailto:{email}?subject=Re: {subject}"
-                   style="display: inline-block; padding: 12px 30px; background: linear-gradient(135deg, {BRAND_PRIMARY} 0%, {BRAND_SECONDARY} 100%); color: white; text-decoration: none; border-radius: 5px; font-weight: 600;">
+                   style="display: inline-block; padding: 12px 30px; background: linear-gradient(135deg, {brand[primary]} 0%, {brand[secondary]} 100%); color: white; text-decoration: none; border-radius: 5px; font-weight: 600;">
                     Reply to {name}
                 </a>
             </div>
         </div>
 
-        <!-- Footer -->
-        <div style="text-align: center; padding: 15px; color: #666; font-size: 12px;">
-            <p>This notification was sent to staff members at Sticker & Magnet Lab</p>
-        </div>
+{footer}
     </div>
 </body>
 </html>
-"""
+""",
+    body_open=_BODY_OPEN_HTML,
+    footer=_STAFF_FOOTER_HTML
+)
+_CONTACT_NOTIFICATION_RENDER = _compile_template(_minify_html(_CONTACT_NOTIFICATION_TMPL))
+
+
+def _render_contact_notification(contact_id: str, name: str, email: str,
+                                 subject: str, message: str, timestamp: str) -> Tuple[str, ...]:
+    """
+    Render the staff contact notification HTML.
+
+    Args:
+        contact_id: Contact reference ID
+        name: Contact name
+        email: Contact email
+        subject: Message subject
+        message: Message content
+        timestamp: Submission timestamp
+
+    Returns:
+        HTML email body chunks for staff
+    """
+    return _CONTACT_NOTIFICATION_RENDER(_escape_fields({
+        'contact_id': contact_id,
+        'name': name,
+        'email': email,
+        'subject': subject,
+        'message': message,
+        'timestamp': timestamp
+    }))
+
+
+def get_contact_notification_html(contact: Dict[str, Any]) -> str:
+    """
+    Generate HTML for staff contact form notification email.
+
+    Args:
+        contact: Contact form data containing:
+            - contactId: Contact reference ID
+            - name: Contact name
+            - email: Contact email
+            - subject: Message subject
+            - message: Message content
+            - timestamp: Submission timestamp
+
+    Returns:
+        Complete HTML email body for staff
+    """
+    return ''.join(_render_contact_notification(
+        contact.get('contactId', 'N/A'),
+        contact.get('name', 'Unknown'),
+        contact.get('email', 'Unknown'),
+        contact.get('subject', 'No Subject'),
+        contact.get('message', ''),
+        contact.get('timestamp', '')
+    ))